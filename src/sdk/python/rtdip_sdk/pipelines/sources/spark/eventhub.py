@@ -120,6 +120,7 @@ class SparkEventhubSource(SourceInterface):
         self.spark = spark
         self.options = options
         self.schema = EVENTHUB_SCHEMA
+        self._encrypt = None
 
     @staticmethod
     def system_type():
@@ -142,6 +143,13 @@ class SparkEventhubSource(SourceInterface):
     def pre_read_validation(self) -> bool:
         return True
 
+    def _encrypted_conn_string(self, connection_string: str) -> str:
+        if self._encrypt is None:
+            self._encrypt = (
+                self.spark.sparkContext._jvm.org.apache.spark.eventhubs.EventHubsUtils.encrypt
+            )
+        return self._encrypt(connection_string)
+
     def post_read_validation(self, df: DataFrame) -> bool:
         assert df.schema == self.schema
         return True
@@ -152,15 +160,13 @@ class SparkEventhubSource(SourceInterface):
         """
         eventhub_connection_string = "eventhubs.connectionString"
         try:
-            if eventhub_connection_string in self.options:
-                sc = self.spark.sparkContext
-                self.options[eventhub_connection_string] = (
-                    sc._jvm.org.apache.spark.eventhubs.EventHubsUtils.encrypt(
-                        self.options[eventhub_connection_string]
-                    )
+            options = dict(self.options)
+            if eventhub_connection_string in options:
+                options[eventhub_connection_string] = self._encrypted_conn_string(
+                    options[eventhub_connection_string]
                 )
 
-            return self.spark.read.format("eventhubs").options(**self.options).load()
+            return self.spark.read.format("eventhubs").options(**options).load()
 
         except Py4JJavaError as e:
             logging.exception(e.errmsg)
@@ -175,17 +181,13 @@ class SparkEventhubSource(SourceInterface):
         """
         eventhub_connection_string = "eventhubs.connectionString"
         try:
-            if eventhub_connection_string in self.options:
-                sc = self.spark.sparkContext
-                self.options[eventhub_connection_string] = (
-                    sc._jvm.org.apache.spark.eventhubs.EventHubsUtils.encrypt(
-                        self.options[eventhub_connection_string]
-                    )
+            options = dict(self.options)
+            if eventhub_connection_string in options:
+                options[eventhub_connection_string] = self._encrypted_conn_string(
+                    options[eventhub_connection_string]
                 )
 
-            return (
-                self.spark.readStream.format("eventhubs").options(**self.options).load()
-            )
+            return self.spark.readStream.format("eventhubs").options(**options).load()
 
         except Py4JJavaError as e:
             logging.exception(e.errmsg)
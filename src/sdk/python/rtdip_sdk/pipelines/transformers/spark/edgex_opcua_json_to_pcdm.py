@@ -12,13 +12,49 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pandas as pd
 from pyspark.sql import DataFrame
-from pyspark.sql.functions import from_json, col, explode, when, lit
+from pyspark.sql.functions import (
+    from_json,
+    col,
+    explode,
+    expr,
+    lit,
+    create_map,
+    coalesce,
+    pandas_udf,
+)
+from pyspark.sql.types import StringType
 
 from ..interfaces import TransformerInterface
 from ..._pipeline_utils.models import Libraries, SystemType
 from ..._pipeline_utils.spark import EDGEX_SCHEMA
 
+EDGEX_SCHEMA_JSON = EDGEX_SCHEMA.json()
+
+VALUE_TYPE_DICT = {
+    "Int8": "integer",
+    "Int16": "integer",
+    "Int32": "integer",
+    "Int64": "integer",
+    "Uint8": "integer",
+    "Uint16": "integer",
+    "Uint32": "integer",
+    "Uint64": "integer",
+    "Float32": "float",
+    "Float64": "float",
+    "Bool": "bool",
+}
+
+EDGEX_JSON_OPTIONS = {
+    "mode": "PERMISSIVE",
+    "allowComments": "false",
+    "allowUnquotedFieldNames": "false",
+    "allowSingleQuotes": "false",
+    "allowNumericLeadingZeros": "false",
+    "allowBackslashEscapingAnyCharacter": "false",
+}
+
 
 class EdgeXOPCUAJsonToPCDMTransformer(TransformerInterface):
     """
@@ -44,6 +80,7 @@ class EdgeXOPCUAJsonToPCDMTransformer(TransformerInterface):
         source_column_name (str): Spark Dataframe column containing the OPC Publisher Json OPC UA data
         status_null_value (optional str): If populated, will replace 'Good' in the Status column with the specified value.
         change_type_value (optional str): If populated, will replace 'insert' in the ChangeType column with the specified value.
+        use_pandas_udf (optional bool): If True, normalizes ValueType with a vectorized pandas UDF instead of a Catalyst map expression. Use when extending VALUE_TYPE_DICT with additional value types.
     """
 
     data: DataFrame
@@ -51,6 +88,7 @@ class EdgeXOPCUAJsonToPCDMTransformer(TransformerInterface):
     status_null_value: str
     change_type_value: str
     tagname_field: str
+    use_pandas_udf: bool
 
     def __init__(
         self,
@@ -59,12 +97,14 @@ class EdgeXOPCUAJsonToPCDMTransformer(TransformerInterface):
         status_null_value: str = "Good",
         change_type_value: str = "insert",
         tagname_field="resourceName",
+        use_pandas_udf: bool = False,
     ) -> None:
         self.data = data
         self.source_column_name = source_column_name
         self.status_null_value = status_null_value
         self.change_type_value = change_type_value
         self.tagname_field = tagname_field
+        self.use_pandas_udf = use_pandas_udf
 
     @staticmethod
     def system_type():
@@ -94,41 +134,34 @@ class EdgeXOPCUAJsonToPCDMTransformer(TransformerInterface):
         Returns:
             DataFrame: A dataframe with the specified column converted to PCDM
         """
-        df = (
+        if self.use_pandas_udf:
+
+            @pandas_udf(StringType())
+            def normalize_value_type(value_type: pd.Series) -> pd.Series:
+                return value_type.map(VALUE_TYPE_DICT).fillna("string")
+
+            value_type = normalize_value_type(col("col.valueType"))
+        else:
+            value_type_map = create_map(
+                [lit(value) for pair in VALUE_TYPE_DICT.items() for value in pair]
+            )
+            value_type = coalesce(value_type_map[col("col.valueType")], lit("string"))
+        return (
             self.data.withColumn(
                 self.source_column_name,
-                from_json(self.source_column_name, EDGEX_SCHEMA),
-            )
-            .select("*", explode("{}.readings".format(self.source_column_name)))
-            .selectExpr(
-                "explode({}.readings.{}) as TagName".format(
-                    self.source_column_name, self.tagname_field
+                from_json(
+                    self.source_column_name, EDGEX_SCHEMA_JSON, EDGEX_JSON_OPTIONS
                 ),
-                "to_utc_timestamp(to_timestamp((col.origin / 1000000000)), current_timezone()) as EventTime",
-                "col.value as Value",
-                "col.valueType as ValueType",
             )
-            .withColumn("Status", lit(self.status_null_value))
-            .withColumn("ChangeType", lit(self.change_type_value))
-            .withColumn(
-                "ValueType",
-                (
-                    when(col("ValueType") == "Int8", "integer")
-                    .when(col("ValueType") == "Int16", "integer")
-                    .when(col("ValueType") == "Int32", "integer")
-                    .when(col("ValueType") == "Int64", "integer")
-                    .when(col("ValueType") == "Uint8", "integer")
-                    .when(col("ValueType") == "Uint16", "integer")
-                    .when(col("ValueType") == "Uint32", "integer")
-                    .when(col("ValueType") == "Uint64", "integer")
-                    .when(col("ValueType") == "Float32", "float")
-                    .when(col("ValueType") == "Float64", "float")
-                    .when(col("ValueType") == "Bool", "bool")
-                    .otherwise("string")
-                ),
+            .select("*", explode("{}.readings".format(self.source_column_name)))
+            .select(
+                explode(
+                    "{}.readings.{}".format(self.source_column_name, self.tagname_field)
+                ).alias("TagName"),
+                expr("timestamp_micros(col.origin div 1000)").alias("EventTime"),
+                lit(self.status_null_value).alias("Status"),
+                col("col.value").alias("Value"),
+                value_type.alias("ValueType"),
+                lit(self.change_type_value).alias("ChangeType"),
             )
         )
-
-        return df.select(
-            "TagName", "EventTime", "Status", "Value", "ValueType", "ChangeType"
-        )
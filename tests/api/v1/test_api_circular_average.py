@@ -25,7 +25,7 @@ from tests.api.v1.api_test_objects import (
     TEST_HEADERS,
     BASE_URL,
 )
-from httpx import AsyncClient
+from httpx import AsyncClient, ASGITransport
 from src.api.v1 import app
 
 MOCK_METHOD = "src.sdk.python.rtdip_sdk.queries.time_series.circular_average.get"
@@ -33,41 +33,52 @@ MOCK_API_NAME = "/api/v1/events/circularaverage"
 
 pytestmark = pytest.mark.anyio
 
+TEST_DATA = pd.DataFrame(
+    {"EventTime": [datetime.utcnow()], "TagName": ["TestTag"], "Value": [1.5]}
+)
+TEST_DATA_ERROR = pd.DataFrame(
+    {"EventTime": [datetime.utcnow()], "TagName": ["TestTag"], "Value": [1.01]}
+)
+EXPECTED_TABLE_JSON = (
+    TEST_DATA.to_json(orient="table", index=False, date_unit="ns").rstrip("}")
+    + ',"pagination":{"limit":null,"offset":null,"next":null}}'
+)
+
 
-async def test_api_circular_average_get_success(mocker: MockerFixture):
-    test_data = pd.DataFrame(
-        {"EventTime": [datetime.utcnow()], "TagName": ["TestTag"], "Value": [1.5]}
+@pytest.fixture(scope="module")
+async def client():
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url=BASE_URL
+    ) as async_client:
+        yield async_client
+
+
+async def test_api_circular_average_get_success(
+    client: AsyncClient, mocker: MockerFixture
+):
+    mocker = mocker_setup(mocker, MOCK_METHOD, TEST_DATA)
+
+    response = await client.get(
+        MOCK_API_NAME,
+        headers=TEST_HEADERS,
+        params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_DICT,
     )
-    mocker = mocker_setup(mocker, MOCK_METHOD, test_data)
-
-    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            MOCK_API_NAME,
-            headers=TEST_HEADERS,
-            params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_DICT,
-        )
     actual = response.text
-    expected = test_data.to_json(orient="table", index=False, date_unit="ns")
-    expected = (
-        expected.rstrip("}") + ',"pagination":{"limit":null,"offset":null,"next":null}}'
-    )
 
     assert response.status_code == 200
-    assert actual == expected
+    assert actual == EXPECTED_TABLE_JSON
 
 
-async def test_api_circular_average_get_validation_error(mocker: MockerFixture):
-    test_data = pd.DataFrame(
-        {"EventTime": [datetime.utcnow()], "TagName": ["TestTag"], "Value": [1.01]}
+async def test_api_circular_average_get_validation_error(
+    client: AsyncClient, mocker: MockerFixture
+):
+    mocker = mocker_setup(mocker, MOCK_METHOD, TEST_DATA_ERROR)
+
+    response = await client.get(
+        MOCK_API_NAME,
+        headers=TEST_HEADERS,
+        params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_ERROR_DICT,
     )
-    mocker = mocker_setup(mocker, MOCK_METHOD, test_data)
-
-    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            MOCK_API_NAME,
-            headers=TEST_HEADERS,
-            params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_ERROR_DICT,
-        )
     actual = response.text
 
     assert response.status_code == 422
@@ -77,62 +88,52 @@ async def test_api_circular_average_get_validation_error(mocker: MockerFixture):
     )
 
 
-async def test_api_circular_average_get_error(mocker: MockerFixture):
-    test_data = pd.DataFrame(
-        {"EventTime": [datetime.utcnow()], "TagName": ["TestTag"], "Value": [1.01]}
-    )
+async def test_api_circular_average_get_error(
+    client: AsyncClient, mocker: MockerFixture
+):
     mocker = mocker_setup(
-        mocker, MOCK_METHOD, test_data, Exception("Error Connecting to Database")
+        mocker, MOCK_METHOD, TEST_DATA_ERROR, Exception("Error Connecting to Database")
     )
 
-    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
-        response = await ac.get(
-            MOCK_API_NAME,
-            headers=TEST_HEADERS,
-            params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_DICT,
-        )
+    response = await client.get(
+        MOCK_API_NAME,
+        headers=TEST_HEADERS,
+        params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_DICT,
+    )
     actual = response.text
 
     assert response.status_code == 400
     assert actual == '{"detail":"Error Connecting to Database"}'
 
 
-async def test_api_circular_average_post_success(mocker: MockerFixture):
-    test_data = pd.DataFrame(
-        {"EventTime": [datetime.utcnow()], "TagName": ["TestTag"], "Value": [1.5]}
+async def test_api_circular_average_post_success(
+    client: AsyncClient, mocker: MockerFixture
+):
+    mocker = mocker_setup(mocker, MOCK_METHOD, TEST_DATA)
+
+    response = await client.post(
+        MOCK_API_NAME,
+        headers=TEST_HEADERS,
+        params=CIRCULAR_AVERAGE_POST_MOCKED_PARAMETER_DICT,
+        json=CIRCULAR_AVERAGE_POST_BODY_MOCKED_PARAMETER_DICT,
     )
-    mocker = mocker_setup(mocker, MOCK_METHOD, test_data)
-
-    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            MOCK_API_NAME,
-            headers=TEST_HEADERS,
-            params=CIRCULAR_AVERAGE_POST_MOCKED_PARAMETER_DICT,
-            json=CIRCULAR_AVERAGE_POST_BODY_MOCKED_PARAMETER_DICT,
-        )
     actual = response.text
-    expected = test_data.to_json(orient="table", index=False, date_unit="ns")
-    expected = (
-        expected.rstrip("}") + ',"pagination":{"limit":null,"offset":null,"next":null}}'
-    )
 
     assert response.status_code == 200
-    assert actual == expected
+    assert actual == EXPECTED_TABLE_JSON
+
 
+async def test_api_circular_average_post_validation_error(
+    client: AsyncClient, mocker: MockerFixture
+):
+    mocker = mocker_setup(mocker, MOCK_METHOD, TEST_DATA_ERROR)
 
-async def test_api_circular_average_post_validation_error(mocker: MockerFixture):
-    test_data = pd.DataFrame(
-        {"EventTime": [datetime.utcnow()], "TagName": ["TestTag"], "Value": [1.01]}
+    response = await client.post(
+        MOCK_API_NAME,
+        headers=TEST_HEADERS,
+        params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_ERROR_DICT,
+        json=CIRCULAR_AVERAGE_POST_BODY_MOCKED_PARAMETER_DICT,
     )
-    mocker = mocker_setup(mocker, MOCK_METHOD, test_data)
-
-    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            MOCK_API_NAME,
-            headers=TEST_HEADERS,
-            params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_ERROR_DICT,
-            json=CIRCULAR_AVERAGE_POST_BODY_MOCKED_PARAMETER_DICT,
-        )
     actual = response.text
 
     assert response.status_code == 422
@@ -142,21 +143,19 @@ async def test_api_circular_average_post_validation_error(mocker: MockerFixture)
     )
 
 
-async def test_api_circular_average_post_error(mocker: MockerFixture):
-    test_data = pd.DataFrame(
-        {"EventTime": [datetime.utcnow()], "TagName": ["TestTag"], "Value": [1.01]}
-    )
+async def test_api_circular_average_post_error(
+    client: AsyncClient, mocker: MockerFixture
+):
     mocker = mocker_setup(
-        mocker, MOCK_METHOD, test_data, Exception("Error Connecting to Database")
+        mocker, MOCK_METHOD, TEST_DATA_ERROR, Exception("Error Connecting to Database")
     )
 
-    async with AsyncClient(app=app, base_url=BASE_URL) as ac:
-        response = await ac.post(
-            MOCK_API_NAME,
-            headers=TEST_HEADERS,
-            params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_DICT,
-            json=CIRCULAR_AVERAGE_POST_BODY_MOCKED_PARAMETER_DICT,
-        )
+    response = await client.post(
+        MOCK_API_NAME,
+        headers=TEST_HEADERS,
+        params=CIRCULAR_AVERAGE_MOCKED_PARAMETER_DICT,
+        json=CIRCULAR_AVERAGE_POST_BODY_MOCKED_PARAMETER_DICT,
+    )
     actual = response.text
 
     assert response.status_code == 400
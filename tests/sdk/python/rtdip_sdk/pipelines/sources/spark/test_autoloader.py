@@ -80,25 +80,11 @@ def test_databricks_autoloader_read_stream(
 ):
     autoloader_source = DataBricksAutoLoaderSource(spark_session, {}, path, "parquet")
     expected_df = spark_session.createDataFrame([{"a": "x"}])
-    mocker.patch.object(
-        autoloader_source,
-        "spark",
-        new_callable=mocker.PropertyMock(
-            return_value=mocker.Mock(
-                readStream=mocker.Mock(
-                    format=mocker.Mock(
-                        return_value=mocker.Mock(
-                            options=mocker.Mock(
-                                return_value=mocker.Mock(
-                                    load=mocker.Mock(return_value=expected_df)
-                                )
-                            )
-                        )
-                    )
-                )
-            )
-        ),
+    mocked_spark = mocker.MagicMock()
+    mocked_spark.readStream.format.return_value.options.return_value.load.return_value = (
+        expected_df
     )
+    mocker.patch.object(autoloader_source, "spark", mocked_spark)
     assert autoloader_source.pre_read_validation()
     df = autoloader_source.read_stream()
     assert isinstance(df, DataFrame)
@@ -109,25 +95,11 @@ def test_databricks_autoloader_read_stream_fails(
     spark_session: SparkSession, mocker: MockerFixture
 ):
     autoloader_source = DataBricksAutoLoaderSource(spark_session, {}, path, "parquet")
-    mocker.patch.object(
-        autoloader_source,
-        "spark",
-        new_callable=mocker.PropertyMock(
-            return_value=mocker.Mock(
-                readStream=mocker.Mock(
-                    format=mocker.Mock(
-                        return_value=mocker.Mock(
-                            options=mocker.Mock(
-                                return_value=mocker.Mock(
-                                    load=mocker.Mock(side_effect=Exception)
-                                )
-                            )
-                        )
-                    )
-                )
-            )
-        ),
+    mocked_spark = mocker.MagicMock()
+    mocked_spark.readStream.format.return_value.options.return_value.load.side_effect = (
+        Exception
     )
+    mocker.patch.object(autoloader_source, "spark", mocked_spark)
 
     with pytest.raises(Exception):
         autoloader_source.read_stream()
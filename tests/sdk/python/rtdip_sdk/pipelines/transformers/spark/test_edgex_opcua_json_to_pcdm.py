@@ -67,3 +67,42 @@ def test_edgex_json_to_pcdm(spark_session: SparkSession):
     assert isinstance(eventhub_json_to_edgex_transformer.libraries(), Libraries)
     assert expected_schema == actual_df.schema
     assert expected_df.collect() == actual_df.collect()
+
+
+def test_edgex_json_to_pcdm_with_pandas_udf(spark_session: SparkSession):
+    edgex_json_data = '{"apiVersion":"v2","id":"test","deviceName":"testDevice","profileName":"test","sourceName":"Bool","origin":1683866798739958852,"readings":[{"id":"test","origin":1683866798739958852,"deviceName":"test","resourceName":"BoolTag","profileName":"Random","valueType":"Bool","value":"true"}]}'
+    edgex_df: DataFrame = spark_session.createDataFrame([{"body": edgex_json_data}])
+
+    expected_schema = StructType(
+        [
+            StructField("TagName", StringType(), True),
+            StructField("EventTime", TimestampType(), True),
+            StructField("Status", StringType(), False),
+            StructField("Value", StringType(), True),
+            StructField("ValueType", StringType(), True),
+            StructField("ChangeType", StringType(), False),
+        ]
+    )
+
+    expected_data = [
+        {
+            "TagName": "BoolTag",
+            "EventTime": datetime.fromisoformat("2023-05-12 04:46:38.739958"),
+            "Status": "Good",
+            "Value": "true",
+            "ValueType": "bool",
+            "ChangeType": "insert",
+        }
+    ]
+
+    expected_df: DataFrame = spark_session.createDataFrame(
+        schema=expected_schema, data=expected_data
+    )
+
+    eventhub_json_to_edgex_transformer = EdgeXOPCUAJsonToPCDMTransformer(
+        data=edgex_df, source_column_name="body", use_pandas_udf=True
+    )
+    actual_df = eventhub_json_to_edgex_transformer.transform()
+
+    assert expected_schema == actual_df.schema
+    assert expected_df.collect() == actual_df.collect()